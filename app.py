@@ -2,17 +2,107 @@
 from __future__ import annotations
 
 import json
+import threading
+from hashlib import md5
 from http import HTTPStatus
-from io import BytesIO
+from io import BytesIO, StringIO
 from pathlib import Path
 from textwrap import dedent
-from typing import Callable, Iterable, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+try:  # Serialisation JSON accélérée (implémentation C), optionnelle.
+    import orjson
+except ImportError:  # pragma: no cover - repli sur la stdlib
+    orjson = None
 
 from src.tetris.profiles import ProfileManager
 
 Headers = List[Tuple[str, str]]
 Body = bytes
 
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+    _JSONDecodeError = (orjson.JSONDecodeError, ValueError)
+else:
+
+    def _json_dumps(payload: object) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+    _json_loads = json.loads
+    _JSONDecodeError = (json.JSONDecodeError, ValueError)
+
+
+# Squelette HTML du tableau de bord, calculé une seule fois à l'import.
+# Seules les deux tables (scores et profils) changent d'une requête à l'autre.
+_INDEX_SHELL = dedent(
+    """
+    <!doctype html>
+    <html lang=\"fr\">
+      <head>
+        <meta charset=\"utf-8\" />
+        <title>Tetris - Tableau de bord</title>
+        <style>
+          body {{ font-family: Arial, sans-serif; margin: 2rem; }}
+          h1, h2 {{ color: #1b1464; }}
+          table {{ border-collapse: collapse; width: 100%; max-width: 600px; }}
+          th, td {{ border: 1px solid #ddd; padding: 0.5rem; text-align: left; }}
+          th {{ background: #f2f2f2; }}
+          .empty {{ font-style: italic; color: #666; }}
+          .container {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 2rem; }}
+          footer {{ margin-top: 3rem; font-size: 0.8rem; color: #666; }}
+        </style>
+      </head>
+      <body>
+        <h1>Tetris - Tableau de bord</h1>
+        <p>Interface web prête pour Hostinger. Utilisez les API pour créer des profils et publier des scores.</p>
+        <div class=\"container\">
+          <section>
+            <h2>Meilleurs scores</h2>
+            {scores}
+          </section>
+          <section>
+            <h2>Profils</h2>
+            {profiles}
+          </section>
+        </div>
+        <footer>
+          <p>Endpoints disponibles : <code>GET /api/profiles</code>, <code>POST /api/profiles</code>, <code>GET /api/scores</code>, <code>POST /api/scores</code>, <code>GET /healthz</code>.</p>
+        </footer>
+      </body>
+    </html>
+    """
+).strip()
+
+_SCORES_TABLE_OPEN = (
+    "<table>\n"
+    "  <thead>\n"
+    "    <tr><th>#</th><th>Profil</th><th>Score</th><th>Lignes</th><th>Joué le</th></tr>\n"
+    "  </thead>\n"
+    "  <tbody>\n"
+)
+_PROFILES_TABLE_OPEN = (
+    "<table>\n"
+    "  <thead>\n"
+    "    <tr><th>Nom</th><th>Meilleur score</th><th>Parties</th><th>Dernière partie</th></tr>\n"
+    "  </thead>\n"
+    "  <tbody>\n"
+)
+_TABLE_CLOSE = "  </tbody>\n</table>\n"
+
+# Table de translation C pour échapper les champs contrôlés par l'utilisateur
+# (nettement plus rapide que html.escape, qui repasse par str.replace).
+_HTML_TRANS = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# Listes d'en-têtes partagées entre réponses ; _response copie toujours dans
+# une liste fraîche, ces constantes ne sont donc jamais mutées.
+_JSON_HEADERS: Headers = [
+    ("Content-Type", "application/json; charset=utf-8"),
+    ("Cache-Control", "no-store"),
+]
+_HTML_HEADERS: Headers = [("Content-Type", "text/html; charset=utf-8")]
+_TEXT_HEADERS: Headers = [("Content-Type", "text/plain; charset=utf-8")]
+
 
 class HTTPError(Exception):
     """Internal exception to propagate HTTP errors through the router."""
@@ -25,7 +115,7 @@ class HTTPError(Exception):
     @property
     def body(self) -> bytes:
         payload = {"error": self.message, "status": self.status.value}
-        return json.dumps(payload).encode("utf-8")
+        return _json_dumps(payload)
 
     @property
     def headers(self) -> Headers:
@@ -47,6 +137,12 @@ class Response:
         return json.loads(self.data.decode("utf-8"))
 
 
+# Tampons partagés par le client de test : les requêtes sans corps n'ont pas
+# besoin de leurs propres BytesIO, et les handlers n'écrivent pas d'erreurs.
+_EMPTY_INPUT = BytesIO(b"")
+_SHARED_ERRORS = BytesIO()
+
+
 class TestClient:
     """WSGI test client with a Flask-like API for unit tests."""
 
@@ -60,6 +156,12 @@ class TestClient:
             body = json.dumps(json_payload).encode("utf-8")
             headers.append(("Content-Type", "application/json"))
 
+        if body:
+            wsgi_input = BytesIO(body)
+        else:
+            wsgi_input = _EMPTY_INPUT
+            wsgi_input.seek(0)
+
         environ = {
             "REQUEST_METHOD": method,
             "PATH_INFO": path,
@@ -68,8 +170,8 @@ class TestClient:
             "SERVER_PROTOCOL": "HTTP/1.1",
             "wsgi.version": (1, 0),
             "wsgi.url_scheme": "http",
-            "wsgi.input": BytesIO(body),
-            "wsgi.errors": BytesIO(),
+            "wsgi.input": wsgi_input,
+            "wsgi.errors": _SHARED_ERRORS,
             "wsgi.multiprocess": False,
             "wsgi.multithread": False,
             "wsgi.run_once": False,
@@ -88,7 +190,13 @@ class TestClient:
             status = status_line
             response_headers = resp_headers
 
-        result = b"".join(self.app(environ, start_response))
+        chunks = self.app(environ, start_response)
+        # L'application renvoie presque toujours [body] : évite le b"".join
+        # (et sa réallocation) dans ce cas.
+        if isinstance(chunks, list) and len(chunks) == 1:
+            result = chunks[0]
+        else:
+            result = b"".join(chunks)
         status_code = int(status.split(" ")[0]) if status else 500
         return Response(status_code, response_headers, result)
 
@@ -104,10 +212,26 @@ class TetrisWSGIApp:
 
     def __init__(self, data_file: Optional[Union[str, Path]] = None) -> None:
         self.data_file = data_file
+        self._cached_manager: Optional[ProfileManager] = None
+        self._manager_lock = threading.Lock()
+        # Table de routage (méthode, chemin) -> handler, consultée en O(1)
+        # au lieu d'une cascade de comparaisons de chaînes par requête.
+        self._routes: Dict[Tuple[str, str], Callable[[dict], Tuple[HTTPStatus, Headers, Body]]] = {
+            ("GET", "/healthz"): lambda environ: self.healthcheck(),
+            ("GET", "/"): self.index,
+            ("GET", "/api/profiles"): lambda environ: self.list_profiles(),
+            ("POST", "/api/profiles"): self.create_profile,
+            ("GET", "/api/scores"): lambda environ: self.list_scores(),
+            ("POST", "/api/scores"): self.create_score,
+        }
 
     # -- Helper utilities -------------------------------------------------
     def _manager(self) -> ProfileManager:
-        return ProfileManager(data_file=self.data_file)
+        if self._cached_manager is None:
+            with self._manager_lock:
+                if self._cached_manager is None:
+                    self._cached_manager = ProfileManager(data_file=self.data_file)
+        return self._cached_manager
 
     def _json_body(self, environ: dict) -> dict:
         try:
@@ -119,8 +243,8 @@ class TetrisWSGIApp:
         if not body:
             return {}
         try:
-            return json.loads(body.decode("utf-8"))
-        except json.JSONDecodeError as exc:
+            return _json_loads(body)
+        except _JSONDecodeError as exc:
             raise HTTPError(HTTPStatus.BAD_REQUEST, f"JSON invalide: {exc}") from exc
 
     # -- Response builders ------------------------------------------------
@@ -133,23 +257,20 @@ class TetrisWSGIApp:
         return status, base_headers, payload
 
     def _json_response(self, payload: object, status: HTTPStatus = HTTPStatus.OK) -> Tuple[HTTPStatus, Headers, Body]:
-        body = json.dumps(payload)
-        headers = [("Content-Type", "application/json; charset=utf-8"), ("Cache-Control", "no-store")]
-        return self._response(body, status, headers)
+        body = _json_dumps(payload)
+        return self._response(body, status, _JSON_HEADERS)
 
     def _html_response(self, body: str, status: HTTPStatus = HTTPStatus.OK) -> Tuple[HTTPStatus, Headers, Body]:
-        headers = [("Content-Type", "text/html; charset=utf-8")]
-        return self._response(body, status, headers)
+        return self._response(body, status, _HTML_HEADERS)
 
     def _text_response(self, body: str, status: HTTPStatus = HTTPStatus.OK) -> Tuple[HTTPStatus, Headers, Body]:
-        headers = [("Content-Type", "text/plain; charset=utf-8")]
-        return self._response(body, status, headers)
+        return self._response(body, status, _TEXT_HEADERS)
 
     # -- Route handlers ---------------------------------------------------
     def healthcheck(self) -> Tuple[HTTPStatus, Headers, Body]:
         return self._text_response("ok", HTTPStatus.OK)
 
-    def index(self) -> Tuple[HTTPStatus, Headers, Body]:
+    def index(self, environ: Optional[dict] = None) -> Tuple[HTTPStatus, Headers, Body]:
         manager = self._manager()
         profiles = manager.list_profiles()
         scores = manager.top_scores(limit=20)
@@ -157,97 +278,56 @@ class TetrisWSGIApp:
         def render_scores() -> str:
             if not scores:
                 return "<p class=\"empty\">Aucun score enregistré pour le moment.</p>"
-            rows = []
-            for idx, entry in enumerate(scores, start=1):
-                rows.append(
-                    "<tr>"
-                    f"<td>{idx}</td>"
-                    f"<td>{entry.get('profile', '?')}</td>"
-                    f"<td>{entry.get('score', 0)}</td>"
-                    f"<td>{entry.get('lines', 0)}</td>"
-                    f"<td>{entry.get('played_at', '-') or '-'}</td>"
-                    "</tr>"
-                )
-            rows_html = "\n".join(rows)
-            return dedent(
-                f"""
-                <table>
-                  <thead>
-                    <tr><th>#</th><th>Profil</th><th>Score</th><th>Lignes</th><th>Joué le</th></tr>
-                  </thead>
-                  <tbody>
-                    {rows_html}
-                  </tbody>
-                </table>
-                """
-            )
+            buf = StringIO()
+            buf.write(_SCORES_TABLE_OPEN)
+            idx = 0
+            for entry in scores:
+                idx += 1
+                buf.write("<tr><td>")
+                buf.write(str(idx))
+                buf.write("</td><td>")
+                buf.write(str(entry.get("profile", "?")).translate(_HTML_TRANS))
+                buf.write("</td><td>")
+                buf.write(str(entry.get("score", 0)))
+                buf.write("</td><td>")
+                buf.write(str(entry.get("lines", 0)))
+                buf.write("</td><td>")
+                buf.write(str(entry.get("played_at") or "-"))
+                buf.write("</td></tr>\n")
+            buf.write(_TABLE_CLOSE)
+            return buf.getvalue()
 
         def render_profiles() -> str:
             if not profiles:
                 return "<p class=\"empty\">Aucun profil créé pour le moment.</p>"
-            rows = []
+            buf = StringIO()
+            buf.write(_PROFILES_TABLE_OPEN)
             for profile in profiles:
-                rows.append(
-                    "<tr>"
-                    f"<td>{profile.name}</td>"
-                    f"<td>{profile.best_score}</td>"
-                    f"<td>{profile.games_played}</td>"
-                    f"<td>{profile.last_played or '-'}</td>"
-                    "</tr>"
-                )
-            rows_html = "\n".join(rows)
-            return dedent(
-                f"""
-                <table>
-                  <thead>
-                    <tr><th>Nom</th><th>Meilleur score</th><th>Parties</th><th>Dernière partie</th></tr>
-                  </thead>
-                  <tbody>
-                    {rows_html}
-                  </tbody>
-                </table>
-                """
-            )
-
-        html = dedent(
-            f"""
-            <!doctype html>
-            <html lang=\"fr\">
-              <head>
-                <meta charset=\"utf-8\" />
-                <title>Tetris - Tableau de bord</title>
-                <style>
-                  body {{ font-family: Arial, sans-serif; margin: 2rem; }}
-                  h1, h2 {{ color: #1b1464; }}
-                  table {{ border-collapse: collapse; width: 100%; max-width: 600px; }}
-                  th, td {{ border: 1px solid #ddd; padding: 0.5rem; text-align: left; }}
-                  th {{ background: #f2f2f2; }}
-                  .empty {{ font-style: italic; color: #666; }}
-                  .container {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 2rem; }}
-                  footer {{ margin-top: 3rem; font-size: 0.8rem; color: #666; }}
-                </style>
-              </head>
-              <body>
-                <h1>Tetris - Tableau de bord</h1>
-                <p>Interface web prête pour Hostinger. Utilisez les API pour créer des profils et publier des scores.</p>
-                <div class=\"container\">
-                  <section>
-                    <h2>Meilleurs scores</h2>
-                    {render_scores()}
-                  </section>
-                  <section>
-                    <h2>Profils</h2>
-                    {render_profiles()}
-                  </section>
-                </div>
-                <footer>
-                  <p>Endpoints disponibles : <code>GET /api/profiles</code>, <code>POST /api/profiles</code>, <code>GET /api/scores</code>, <code>POST /api/scores</code>, <code>GET /healthz</code>.</p>
-                </footer>
-              </body>
-            </html>
-            """
-        ).strip()
-        return self._html_response(html, HTTPStatus.OK)
+                buf.write("<tr><td>")
+                buf.write(profile.name.translate(_HTML_TRANS))
+                buf.write("</td><td>")
+                buf.write(str(profile.best_score))
+                buf.write("</td><td>")
+                buf.write(str(profile.games_played))
+                buf.write("</td><td>")
+                buf.write(profile.last_played or "-")
+                buf.write("</td></tr>\n")
+            buf.write(_TABLE_CLOSE)
+            return buf.getvalue()
+
+        scores_html = render_scores()
+        profiles_html = render_profiles()
+        # Validateur dérivé des fragments rendus eux-mêmes : tout changement
+        # visible (nouvelle ligne de score, compteurs de profil) change l'ETag.
+        digest = md5(scores_html.encode("utf-8") + b"\x00" + profiles_html.encode("utf-8"))
+        etag = f'"{digest.hexdigest()}"'
+        if environ is not None and environ.get("HTTP_IF_NONE_MATCH") == etag:
+            return self._response(b"", HTTPStatus.NOT_MODIFIED, [("ETag", etag)])
+
+        html = _INDEX_SHELL.format(scores=scores_html, profiles=profiles_html)
+        status, headers, body = self._html_response(html, HTTPStatus.OK)
+        headers.append(("ETag", etag))
+        return status, headers, body
 
     def list_profiles(self) -> Tuple[HTTPStatus, Headers, Body]:
         manager = self._manager()
@@ -297,20 +377,10 @@ class TetrisWSGIApp:
         path = environ.get("PATH_INFO", "") or "/"
 
         try:
-            if method == "GET" and path == "/healthz":
-                status, headers, body = self.healthcheck()
-            elif method == "GET" and path == "/":
-                status, headers, body = self.index()
-            elif method == "GET" and path == "/api/profiles":
-                status, headers, body = self.list_profiles()
-            elif method == "POST" and path == "/api/profiles":
-                status, headers, body = self.create_profile(environ)
-            elif method == "GET" and path == "/api/scores":
-                status, headers, body = self.list_scores()
-            elif method == "POST" and path == "/api/scores":
-                status, headers, body = self.create_score(environ)
-            else:
+            handler = self._routes.get((method, path))
+            if handler is None:
                 raise HTTPError(HTTPStatus.NOT_FOUND, "Ressource introuvable")
+            status, headers, body = handler(environ)
         except HTTPError as exc:
             status, headers, body = self._response(
                 exc.body, exc.status, list(exc.headers)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+from io import StringIO
 from typing import Optional
 
 from src.tetris.game import Game
@@ -10,24 +11,29 @@ from src.tetris.profiles import Profile, ProfileManager
 from src.tetris.scores import ScoreManager
 
 
+# Bordures déjà rendues, indexées par largeur de plateau.
+_BORDER_CACHE: dict[int, str] = {}
+
+
 def render_board(game: Game) -> str:
-    grid = game.current_board()
-    lines = []
-    border = "+" + "-" * game.board.width + "+"
-    lines.append(border)
-    for row in grid:
-        line = "|" + "".join(cell[0] if cell else "." for cell in row) + "|"
-        lines.append(line)
-    lines.append(border)
-    return "\n".join(lines)
+    border = _BORDER_CACHE.setdefault(game.board.width, "+" + "-" * game.board.width + "+")
+    buf = StringIO()
+    buf.write(border)
+    for row in game.current_board_rows():
+        buf.write("\n|")
+        buf.write("".join([cell[0] if cell else "." for cell in row]))
+        buf.write("|")
+    buf.write("\n")
+    buf.write(border)
+    return buf.getvalue()
 
 
 def select_profile(manager: ProfileManager) -> Profile:
     while True:
-        profiles = manager.list_profiles()
-        if profiles:
+        ordered = sorted(manager.list_profiles(), key=lambda p: p.name)
+        if ordered:
             print("Profils existants :")
-            for idx, profile in enumerate(sorted(profiles, key=lambda p: p.name), start=1):
+            for idx, profile in enumerate(ordered, start=1):
                 print(f"  {idx}. {profile.name} (meilleur score: {profile.best_score})")
         else:
             print("Aucun profil. Créons-en un !")
@@ -44,10 +50,10 @@ def select_profile(manager: ProfileManager) -> Profile:
             except ValueError as exc:
                 print(exc)
                 continue
-        if choice.isdigit() and profiles:
+        if choice.isdigit() and ordered:
             index = int(choice) - 1
-            if 0 <= index < len(profiles):
-                profile = sorted(profiles, key=lambda p: p.name)[index]
+            if 0 <= index < len(ordered):
+                profile = ordered[index]
                 manager.set_active_profile(profile.name)
                 return profile
         print("Choix invalide. Réessayez.")
@@ -70,22 +76,27 @@ def run_game(profile: Profile, manager: ProfileManager) -> None:
     game.start(profile.name)
 
     print("\nCommandes : a= gauche, d= droite, s= descente, w= rotation, espace= chute, q= quitter")
+    dirty = True
     while not game.game_over and game.active:
-        print(render_board(game))
-        print(f"Score: {game.score_manager.score} | Lignes: {game.score_manager.total_lines}")
+        if dirty:
+            print(render_board(game))
+            print(f"Score: {game.score_manager.score} | Lignes: {game.score_manager.total_lines}")
+            dirty = False
         command = input("Commande : ").strip().lower()
         if command == "a":
-            game.move_left()
+            dirty = game.move_left() or dirty
         elif command == "d":
-            game.move_right()
+            dirty = game.move_right() or dirty
         elif command == "s":
             moved = game.soft_drop()
             if not moved:
                 game.tick()
+            dirty = True
         elif command == "w":
-            game.rotate()
+            dirty = game.rotate() or dirty
         elif command == " ":
             game.hard_drop()
+            dirty = True
         elif command == "q":
             game.game_over = True
             game.active = None
@@ -94,6 +105,7 @@ def run_game(profile: Profile, manager: ProfileManager) -> None:
             continue
         if command not in {"s", " ", "q"}:
             game.tick()
+            dirty = True
 
     try:
         snapshot = game.score_manager.finalize()
@@ -4,11 +4,24 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Iterable, List, Optional, Sequence, Tuple
 
+try:  # Accélère la détection des lignes pleines, optionnel.
+    import numpy as np
+except ImportError:  # pragma: no cover - repli pur Python
+    np = None
+
 from .tetromino import TetrominoState
 
 Cell = Optional[str]
 Coordinate = Tuple[int, int]
 
+# The playfield is stored as a flat bytearray (one byte per cell) so the whole
+# board stays a single contiguous buffer instead of a list of lists of Python
+# objects. 0 means empty; 1-7 map to the seven tetrominoes and 8 is a generic
+# filler block (pre-filled garbage rows).
+_PIECE_TO_ID = {"I": 1, "O": 2, "T": 3, "S": 4, "Z": 5, "J": 6, "L": 7, "X": 8}
+_ID_TO_NAME = {value: name for name, value in _PIECE_TO_ID.items()}
+_GARBAGE_ID = _PIECE_TO_ID["X"]
+
 
 @dataclass
 class Board:
@@ -16,44 +29,122 @@ class Board:
 
     width: int = 10
     height: int = 20
-    grid: List[List[Cell]] = field(init=False)
+    grid: bytearray = field(init=False)
+    # Parallel occupancy bitmap: one int per row, bit x set when column x is
+    # occupied. Kept in sync with `grid` so collision tests are integer ANDs.
+    row_bits: List[int] = field(init=False)
 
     def __post_init__(self) -> None:
-        self.grid = [[None for _ in range(self.width)] for _ in range(self.height)]
+        self.grid = bytearray(self.width * self.height)
+        self.row_bits = [0] * self.height
 
     def reset(self) -> None:
         """Reset the board to an empty state."""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.grid[y][x] = None
+        self.grid[:] = bytes(len(self.grid))
+        self.row_bits = [0] * self.height
 
     def in_bounds(self, x: int, y: int) -> bool:
         return 0 <= x < self.width and 0 <= y < self.height
 
+    def cell(self, x: int, y: int) -> Cell:
+        """Return the piece name occupying (x, y), or None when empty."""
+        return _ID_TO_NAME.get(self.grid[y * self.width + x])
+
+    def set_cell(self, x: int, y: int, value: Cell) -> None:
+        """Write a single cell; value is a piece name or None to clear."""
+        if value:
+            self.grid[y * self.width + x] = _PIECE_TO_ID.get(value, _GARBAGE_ID)
+            self.row_bits[y] |= 1 << x
+        else:
+            self.grid[y * self.width + x] = 0
+            self.row_bits[y] &= ~(1 << x)
+
+    def iter_rows(self) -> Iterable[List[Cell]]:
+        """Yield the grid row by row as lists of piece names."""
+        width = self.width
+        for y in range(self.height):
+            yield [_ID_TO_NAME.get(cell_id) for cell_id in self.grid[y * width:(y + 1) * width]]
+
+    def rows(self) -> List[List[Cell]]:
+        """Materialize the grid as a list of rows of piece names."""
+        return list(self.iter_rows())
+
     def can_place(self, blocks: Sequence[Coordinate]) -> bool:
         """Check whether the given block coordinates can be placed."""
+        # Lecture des attributs une seule fois : la boucle interne ne fait
+        # plus que des LOAD_FAST.
+        width, height, grid = self.width, self.height, self.grid
         for x, y in blocks:
-            if x < 0 or x >= self.width:
+            if not (0 <= x < width) or y >= height:
                 return False
-            if y >= self.height:
+            if y >= 0 and grid[y * width + x]:
                 return False
-            if y >= 0 and self.grid[y][x] is not None:
+        return True
+
+    def can_place_state(self, state: TetrominoState, origin: Coordinate) -> bool:
+        """Bitmask fast path of :meth:`can_place` for a piece state at an origin.
+
+        Each of the up-to-four occupied tile rows is tested against the board's
+        row bitmap with shifts and a single AND, instead of iterating the block
+        coordinates one by one.
+        """
+        mask = state.bitmask
+        ox, oy = origin
+        width = self.width
+        height = self.height
+        bits = self.row_bits
+        shift = ox - 2
+        for r in range(4):
+            row_mask = (mask >> (r * 4)) & 0xF
+            if not row_mask:
+                continue
+            if shift >= 0:
+                shifted = row_mask << shift
+            else:
+                if row_mask & ((1 << -shift) - 1):
+                    return False  # déborde à gauche
+                shifted = row_mask >> -shift
+            if shifted >> width:
+                return False  # déborde à droite
+            y = oy + r - 1
+            if y >= height:
+                return False
+            if y >= 0 and bits[y] & shifted:
                 return False
         return True
 
     def lock_piece(self, blocks: Sequence[Coordinate], value: str) -> None:
         """Lock the piece's blocks into the grid."""
+        piece_id = _PIECE_TO_ID.get(value, _GARBAGE_ID)
         for x, y in blocks:
             if y < 0:
                 continue
-            self.grid[y][x] = value
+            self.grid[y * self.width + x] = piece_id
+            self.row_bits[y] |= 1 << x
 
     def clear_full_lines(self) -> int:
         """Remove filled lines from the board and return how many were cleared."""
-        remaining = [row for row in self.grid if any(cell is None for cell in row)]
-        cleared = self.height - len(remaining)
+        width = self.width
+        full_row = (1 << width) - 1
+        if np is not None:
+            arr = np.frombuffer(self.grid, dtype=np.uint8).reshape(self.height, width)
+            full = arr.all(axis=1)
+            cleared = int(full.sum())
+            if cleared:
+                self.grid[:] = bytes(cleared * width) + arr[~full].tobytes()
+                self.row_bits = [0] * cleared + [b for b in self.row_bits if b != full_row]
+            return cleared
+        remaining = bytearray()
+        remaining_bits = []
+        for y in range(self.height):
+            bits = self.row_bits[y]
+            if bits != full_row:
+                remaining += self.grid[y * width:(y + 1) * width]
+                remaining_bits.append(bits)
+        cleared = self.height - len(remaining_bits)
         if cleared:
-            self.grid = [[None for _ in range(self.width)] for _ in range(cleared)] + remaining
+            self.grid[:] = bytes(cleared * width) + remaining
+            self.row_bits = [0] * cleared + remaining_bits
         return cleared
 
     def iter_with_piece(self, state: TetrominoState, origin: Coordinate) -> Iterable[Tuple[int, int, Cell]]:
@@ -61,11 +152,10 @@ class Board:
         piece_coords = {(origin[0] + dx, origin[1] + dy) for dx, dy in state.blocks}
         for y in range(self.height):
             for x in range(self.width):
-                value = self.grid[y][x]
                 if (x, y) in piece_coords:
                     yield x, y, state.tetromino.name
                 else:
-                    yield x, y, value
+                    yield x, y, _ID_TO_NAME.get(self.grid[y * self.width + x])
 
     def project_piece(self, state: TetrominoState, origin: Coordinate) -> Sequence[Coordinate]:
         """Return the absolute coordinates for a piece at a given origin."""
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Tuple
+from functools import cached_property
+from typing import Iterable, List, Optional, Tuple
 
 from .board import Board
 from .scores import ScoreManager
@@ -12,13 +13,17 @@ from .tetromino import ALL_TETROMINOES, Tetromino, TetrominoState
 Coordinate = Tuple[int, int]
 
 
-@dataclass
+@dataclass(frozen=True)
 class ActivePiece:
     state: TetrominoState
     origin: Coordinate
 
-    def blocks(self) -> Sequence[Coordinate]:
-        return [(self.origin[0] + dx, self.origin[1] + dy) for dx, dy in self.state.blocks]
+    @cached_property
+    def blocks(self) -> Tuple[Coordinate, ...]:
+        # state et origin sont immuables : les coordonnées absolues peuvent
+        # être calculées une seule fois par pièce construite.
+        ox, oy = self.origin
+        return tuple((ox + dx, oy + dy) for dx, dy in self.state.blocks)
 
 
 class Game:
@@ -33,7 +38,8 @@ class Game:
     ) -> None:
         self.board = board or Board()
         self.score_manager = score_manager or ScoreManager()
-        self._piece_sequence = list(piece_sequence) if piece_sequence else None
+        # Stockée inversée pour que _draw_from_sequence dépile en O(1).
+        self._piece_sequence = list(piece_sequence)[::-1] if piece_sequence else None
         self._rng = rng or random.Random()
         self._bag: List[Tetromino] = []
         self.active: Optional[ActivePiece] = None
@@ -55,13 +61,16 @@ class Game:
             raise RuntimeError("No predefined sequence configured")
         if not self._piece_sequence:
             raise StopIteration
-        return self._piece_sequence.pop(0)
+        return self._piece_sequence.pop()
 
     def _draw_from_bag(self) -> Tetromino:
-        if not self._bag:
-            self._bag = list(ALL_TETROMINOES)
-            self._rng.shuffle(self._bag)
-        return self._bag.pop(0)
+        bag = self._bag
+        if not bag:
+            # Recopie en place dans la liste préallouée plutôt que d'en
+            # reconstruire une nouvelle à chaque sac de 7 pièces.
+            bag[:] = ALL_TETROMINOES
+            self._rng.shuffle(bag)
+        return bag.pop()
 
     def _next_tetromino(self) -> Tetromino:
         return self._draw_from_sequence() if self._piece_sequence is not None else self._draw_from_bag()
@@ -76,7 +85,7 @@ class Game:
         state = tetromino.rotated(0)
         origin = (self.board.width // 2, 0)
         active = ActivePiece(state=state, origin=origin)
-        if not self.board.can_place(active.blocks()):
+        if not self.board.can_place_state(state, origin):
             self.game_over = True
             self.active = None
             return
@@ -88,8 +97,7 @@ class Game:
         if not self.active or self.game_over:
             return False
         new_origin = (self.active.origin[0] + dx, self.active.origin[1] + dy)
-        new_blocks = [(new_origin[0] + dx, new_origin[1] + dy) for dx, dy in self.active.state.blocks]
-        if not self.board.can_place(new_blocks):
+        if not self.board.can_place_state(self.active.state, new_origin):
             return False
         if dy > 0:
             self.score_manager.add_soft_drop(1)
@@ -119,8 +127,7 @@ class Game:
             return False
         delta = 1 if clockwise else -1
         new_state = self.active.state.tetromino.rotated(self.active.state.rotation_index + delta)
-        new_blocks = [(self.active.origin[0] + dx, self.active.origin[1] + dy) for dx, dy in new_state.blocks]
-        if not self.board.can_place(new_blocks):
+        if not self.board.can_place_state(new_state, self.active.origin):
             return False
         self.active = ActivePiece(new_state, self.active.origin)
         return True
@@ -136,7 +143,7 @@ class Game:
     def lock_piece(self) -> None:
         if not self.active:
             return
-        blocks = self.active.blocks()
+        blocks = self.active.blocks
         self.board.lock_piece(blocks, self.active.state.tetromino.name)
         lines = self.board.clear_full_lines()
         self.score_manager.record_line_clear(lines)
@@ -152,11 +159,25 @@ class Game:
 
     # --- Inspection -------------------------------------------------------
 
-    def current_board(self) -> List[List[Optional[str]]]:
-        grid = [[cell for cell in row] for row in self.board.grid]
-        if not self.active:
-            return grid
-        for x, y in self.active.blocks():
+    def current_board_rows(self) -> Iterable[List[Optional[str]]]:
+        """Yield board rows one at a time with the active piece overlaid.
+
+        Rendering paths can consume rows lazily without paying for a full
+        grid copy per frame.
+        """
+        active = self.active
+        if not active:
+            yield from self.board.iter_rows()
+            return
+        name = active.state.tetromino.name
+        piece_columns: dict = {}
+        for x, y in active.blocks:
             if 0 <= y < self.board.height and 0 <= x < self.board.width:
-                grid[y][x] = self.active.state.tetromino.name
-        return grid
+                piece_columns.setdefault(y, []).append(x)
+        for y, row in enumerate(self.board.iter_rows()):
+            for x in piece_columns.get(y, ()):
+                row[x] = name
+            yield row
+
+    def current_board(self) -> List[List[Optional[str]]]:
+        return list(self.current_board_rows())
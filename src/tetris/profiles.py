@@ -3,20 +3,67 @@ from __future__ import annotations
 
 import json
 import os
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from heapq import nlargest
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
+
+try:  # Sérialisation JSON accélérée, optionnelle.
+    import orjson
+except ImportError:  # pragma: no cover - repli sur la stdlib
+    orjson = None
 
 DATA_DIR = Path("data")
 DATA_FILE = DATA_DIR / "profiles.json"
 
+# Sortie compacte par défaut : le fichier est lu par la machine. Positionner
+# TETRIS_PRETTY_JSON=1 pour retrouver l'indentation en développement.
+_PRETTY_JSON = os.environ.get("TETRIS_PRETTY_JSON", "0") not in ("", "0")
+
+if orjson is not None:
+    _DUMPS_OPTION = orjson.OPT_INDENT_2 if _PRETTY_JSON else 0
+
+    def _dumps(data: object) -> bytes:
+        return orjson.dumps(data, option=_DUMPS_OPTION)
+
+    _dumps_compact = orjson.dumps
+    _loads = orjson.loads
+else:
+    # Encodeurs/décodeur construits une seule fois plutôt qu'à chaque appel
+    # de json.dumps/json.loads.
+    _ENCODER = json.JSONEncoder(indent=2) if _PRETTY_JSON else json.JSONEncoder(separators=(",", ":"))
+    _COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+    _DECODER = json.JSONDecoder()
+
+    def _dumps(data: object) -> bytes:
+        return _ENCODER.encode(data).encode("utf-8")
+
+    def _dumps_compact(data: object) -> bytes:
+        return _COMPACT_ENCODER.encode(data).encode("utf-8")
+
+    def _loads(buf: Union[bytes, str]) -> object:
+        if isinstance(buf, bytes):
+            buf = buf.decode("utf-8")
+        return _DECODER.decode(buf)
+
 
 def _now() -> str:
-    return datetime.utcnow().isoformat() + "Z"
+    # Formatage direct depuis l'epoch : pas de construction de datetime ni
+    # de dispatch isoformat, uniquement du formatage d'entiers.
+    now = time.time()
+    microseconds = int((now - int(now)) * 1_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + f".{microseconds:06d}Z"
 
 
-@dataclass
+_PROFILE_FIELDS = ("name", "created_at", "last_played", "games_played", "best_score")
+# attrgetter extrait les cinq champs en un seul appel C.
+_PROFILE_VALUES = attrgetter(*_PROFILE_FIELDS)
+
+
+@dataclass(slots=True)
 class Profile:
     name: str
     created_at: str
@@ -25,22 +72,16 @@ class Profile:
     best_score: int = 0
 
     def to_dict(self) -> Dict[str, object]:
-        return {
-            "name": self.name,
-            "created_at": self.created_at,
-            "last_played": self.last_played,
-            "games_played": self.games_played,
-            "best_score": self.best_score,
-        }
+        return dict(zip(_PROFILE_FIELDS, _PROFILE_VALUES(self)))
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "Profile":
         return cls(
-            name=data["name"],
-            created_at=data["created_at"],
-            last_played=data.get("last_played"),
-            games_played=int(data.get("games_played", 0)),
-            best_score=int(data.get("best_score", 0)),
+            data["name"],
+            data["created_at"],
+            data.get("last_played"),
+            int(data.get("games_played", 0)),
+            int(data.get("best_score", 0)),
         )
 
 
@@ -54,69 +95,154 @@ class ProfileManager:
         else:
             data_file = Path(data_file)
         self.data_file = data_file
-        self._data = self._load()
+        # Journal des scores en append-only : chaque partie ajoute une ligne
+        # JSON au lieu de réécrire tout l'historique dans profiles.json.
+        self.scores_file = data_file.with_name("scores.jsonl")
+        # État de l'écriture différée : lignes de score en attente et
+        # métadonnées modifiées mais pas encore sauvegardées.
+        self._pending_scores: List[Dict[str, object]] = []
+        self._dirty = False
+        self._batching = False
+        raw = self._load()
+        # Les profils vivent en mémoire comme dataclasses ; la vue JSON n'est
+        # reconstruite qu'au moment de save().
+        self._profiles: Dict[str, Profile] = {
+            name: Profile.from_dict(value) for name, value in raw["profiles"].items()
+        }
+        self._active: Optional[str] = raw["active_profile"]
+        # Référence directe vers le profil actif : évite le passage par le
+        # dictionnaire sur le chemin chaud de record_game.
+        self._active_obj: Optional[Profile] = (
+            self._profiles.get(self._active) if self._active else None
+        )
+        self._scores: List[Dict[str, object]] = raw["scores"]
 
     def _load(self) -> Dict[str, object]:
-        if not self.data_file.exists():
+        # EAFP : un seul appel système (open) au lieu d'un stat suivi d'un
+        # open, sans fenêtre de course entre les deux.
+        try:
+            buf = self.data_file.read_bytes()
+        except FileNotFoundError:
             return {"active_profile": None, "profiles": {}, "scores": []}
-        with self.data_file.open("r", encoding="utf-8") as fh:
-            return json.load(fh)
+        data = _loads(buf)
+        # Normalise les clés une fois pour toutes : plus aucun .get/setdefault
+        # défensif nécessaire en aval.
+        data.setdefault("active_profile", None)
+        data.setdefault("profiles", {})
+        data.setdefault("scores", [])
+        return data
 
     def save(self) -> None:
+        payload = {
+            "active_profile": self._active,
+            "profiles": {name: profile.to_dict() for name, profile in self._profiles.items()},
+            "scores": self._scores,
+        }
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.data_file.open("w", encoding="utf-8") as fh:
-            json.dump(self._data, fh, indent=2)
+        # Écriture dans un fichier temporaire puis bascule atomique : pas
+        # d'état partiel si le processus meurt en pleine écriture.
+        tmp = self.data_file.with_suffix(self.data_file.suffix + ".tmp")
+        try:
+            tmp.write_bytes(_dumps(payload))
+            os.replace(tmp, self.data_file)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Write any buffered score rows and unsaved profile metadata."""
+        if self._pending_scores:
+            self.scores_file.parent.mkdir(parents=True, exist_ok=True)
+            with self.scores_file.open("ab") as fh:
+                for row in self._pending_scores:
+                    fh.write(_dumps_compact(row))
+                    fh.write(b"\n")
+            self._pending_scores.clear()
+        if self._dirty:
+            self.save()
+
+    @contextmanager
+    def batch(self) -> Iterator["ProfileManager"]:
+        """Defer all disk writes inside the block to a single flush at exit."""
+        previous = self._batching
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = previous
+            if not previous:
+                self.flush()
 
     def list_profiles(self) -> List[Profile]:
-        return [Profile.from_dict(value) for value in self._data["profiles"].values()]
+        return list(self._profiles.values())
 
     def get_profile(self, name: str) -> Optional[Profile]:
-        profile_data = self._data["profiles"].get(name)
-        return Profile.from_dict(profile_data) if profile_data else None
+        return self._profiles.get(name)
 
     def create_profile(self, name: str) -> Profile:
-        if name in self._data["profiles"]:
+        if name in self._profiles:
             raise ValueError(f"Le profil '{name}' existe déjà")
         profile = Profile(name=name, created_at=_now())
-        self._data["profiles"][name] = profile.to_dict()
-        self._data["active_profile"] = name
-        self.save()
+        self._profiles[name] = profile
+        self._active = name
+        self._active_obj = profile
+        self._dirty = True
+        if not self._batching:
+            self.save()
         return profile
 
     def set_active_profile(self, name: str) -> Profile:
         profile = self.get_profile(name)
         if not profile:
             raise ValueError(f"Profil inconnu: {name}")
-        self._data["active_profile"] = name
-        self.save()
+        self._active = name
+        self._active_obj = profile
+        self._dirty = True
+        if not self._batching:
+            self.save()
         return profile
 
     def get_active_profile(self) -> Optional[Profile]:
-        active_name = self._data.get("active_profile")
-        if not active_name:
-            return None
-        return self.get_profile(active_name)
+        return self._active_obj
 
-    def record_game(self, profile_name: str, score: int, lines: int) -> None:
-        profile = self.get_profile(profile_name)
+    def record_game(self, profile_name: str, score: int, lines: int, flush: bool = True) -> None:
+        if profile_name == self._active:
+            profile = self._active_obj
+        else:
+            profile = self.get_profile(profile_name)
         if not profile:
             raise ValueError(f"Profil inconnu: {profile_name}")
+        now = _now()
         profile.games_played += 1
-        profile.last_played = _now()
+        profile.last_played = now
         if score > profile.best_score:
             profile.best_score = score
-        self._data["profiles"][profile_name] = profile.to_dict()
-        self._data.setdefault("scores", []).append(
+        self._pending_scores.append(
             {
                 "profile": profile_name,
                 "score": score,
                 "lines": lines,
-                "played_at": profile.last_played,
+                "played_at": now,
             }
         )
-        self.save()
+        self._dirty = True
+        if flush and not self._batching:
+            self.flush()
+
+    def _iter_scores(self) -> Iterator[Dict[str, object]]:
+        """Yield every recorded score, legacy rows first then the jsonl log."""
+        yield from self._scores
+        try:
+            with self.scores_file.open("rb") as fh:
+                for line in fh:
+                    if line.strip():
+                        yield _loads(line)
+        except FileNotFoundError:
+            pass
+        yield from self._pending_scores
 
     def top_scores(self, limit: int = 10) -> List[Dict[str, object]]:
-        scores = list(self._data.get("scores", []))
-        scores.sort(key=lambda item: item["score"], reverse=True)
-        return scores[:limit]
+        # O(N log limit) : seuls `limit` éléments vivent dans le tas, et la
+        # clé est extraite en C par itemgetter.
+        return nlargest(limit, self._iter_scores(), key=itemgetter("score"))
@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import ClassVar, Dict, Optional
 
 from .profiles import ProfileManager
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreSnapshot:
     score: int
     lines: int
@@ -16,10 +16,12 @@ class ScoreSnapshot:
 class ScoreManager:
     """Compute Tetris scores and persist results."""
 
-    line_scores: Dict[int, int] = {1: 100, 2: 300, 3: 500, 4: 800}
-    combo_bonus: int = 50
-    soft_drop_bonus: int = 1
-    hard_drop_bonus: int = 2
+    __slots__ = ("profile_manager", "score", "total_lines", "combo_streak", "active_profile")
+
+    line_scores: ClassVar[Dict[int, int]] = {1: 100, 2: 300, 3: 500, 4: 800}
+    combo_bonus: ClassVar[int] = 50
+    soft_drop_bonus: ClassVar[int] = 1
+    hard_drop_bonus: ClassVar[int] = 2
 
     def __init__(self, profile_manager: Optional[ProfileManager] = None) -> None:
         self.profile_manager = profile_manager or ProfileManager()
@@ -37,12 +39,12 @@ class ScoreManager:
     def add_soft_drop(self, cells: int) -> None:
         if cells <= 0:
             return
-        self.score += cells * self.soft_drop_bonus
+        self.score += cells * ScoreManager.soft_drop_bonus
 
     def add_hard_drop(self, cells: int) -> None:
         if cells <= 0:
             return
-        self.score += cells * self.hard_drop_bonus
+        self.score += cells * ScoreManager.hard_drop_bonus
 
     def record_line_clear(self, lines: int) -> int:
         if lines <= 0:
@@ -50,7 +52,7 @@ class ScoreManager:
             return 0
         self.combo_streak += 1
         self.total_lines += lines
-        base = self.line_scores.get(lines, lines * 100)
+        base = _LINE_SCORE_TABLE[lines] if lines < 5 else lines * 100
         combo_points = (self.combo_streak - 1) * self.combo_bonus
         gained = base + combo_points
         self.score += gained
@@ -62,3 +64,8 @@ class ScoreManager:
         snapshot = ScoreSnapshot(score=self.score, lines=self.total_lines)
         self.profile_manager.record_game(self.active_profile, snapshot.score, snapshot.lines)
         return snapshot
+
+
+# Barème dérivé de line_scores sous forme de tuple : l'indexation par petit
+# entier évite le hachage et l'appel dict.get dans record_line_clear.
+_LINE_SCORE_TABLE = (0,) + tuple(ScoreManager.line_scores[i] for i in range(1, 5))
@@ -1,36 +1,84 @@
 """Tetromino definitions and rotation logic for the Tetris game."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+try:  # Tables de formes vectorisées, optionnelles.
+    import numpy as np
+except ImportError:  # pragma: no cover - repli pur Python
+    np = None
 
 Coordinate = Tuple[int, int]
 
 
-@dataclass(frozen=True)
+def _rotation_bitmask(blocks: Tuple[Coordinate, ...]) -> int:
+    """Pack a rotation into a 16-bit mask over its 4x4 footprint.
+
+    Cell (dx, dy) maps to bit (dy + 1) * 4 + (dx + 2), covering offsets
+    dx in [-2, 1] and dy in [-1, 2] — enough for every rotation defined below.
+    """
+    mask = 0
+    for dx, dy in blocks:
+        mask |= 1 << ((dy + 1) * 4 + (dx + 2))
+    return mask
+
+
+@dataclass(frozen=True, slots=True)
 class Tetromino:
     """Representation of a tetromino shape with its rotation states."""
 
     name: str
     rotations: Tuple[Tuple[Coordinate, ...], ...]
     color: str = ""
+    bitmasks: Tuple[int, ...] = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "bitmasks", tuple(_rotation_bitmask(rot) for rot in self.rotations)
+        )
 
     def rotated(self, rotation_index: int) -> "TetrominoState":
-        """Return a TetrominoState for the rotation index modulo rotation count."""
-        index = rotation_index % len(self.rotations)
-        return TetrominoState(self, index)
+        """Return a TetrominoState for the rotation index modulo rotation count.
+
+        There are only 7 pieces with at most 4 rotations each, so the states
+        are memoized (see :func:`_state`) and every rotate/spawn after
+        warm-up is a cache hit. Every piece has 1, 2 or 4 rotations, so the
+        modulo reduces to a bitwise AND.
+        """
+        index = rotation_index & (len(self.rotations) - 1)
+        key = id(self)
+        if key not in _BY_ID:
+            # Référence forte : l'objet ne peut pas être libéré, son id reste
+            # donc un identifiant stable pour le cache.
+            _BY_ID[key] = self
+        return _state(key, index)
 
 
-@dataclass(frozen=True)
-class TetrominoState:
-    """A specific rotation state of a tetromino."""
+class TetrominoState(NamedTuple):
+    """A specific rotation state of a tetromino.
+
+    blocks and bitmask are resolved once by :meth:`Tetromino.rotated`, so
+    hot-path readers get C-level tuple slot access instead of property calls.
+    """
 
     tetromino: Tetromino
     rotation_index: int
+    blocks: Tuple[Coordinate, ...]
+    bitmask: int
+
+
+# Pièces connues du cache de rotations, indexées par id().
+_BY_ID: dict = {}
 
-    @property
-    def blocks(self) -> Tuple[Coordinate, ...]:
-        return self.tetromino.rotations[self.rotation_index]
+
+@lru_cache(maxsize=64)
+def _state(tetromino_id: int, index: int) -> TetrominoState:
+    tetromino = _BY_ID[tetromino_id]
+    return TetrominoState(
+        tetromino, index, tetromino.rotations[index], tetromino.bitmasks[index]
+    )
 
 
 # fmt: off
@@ -104,3 +152,38 @@ L = Tetromino(
 # fmt: on
 
 ALL_TETROMINOES: Tuple[Tetromino, ...] = (I, O, T, S, Z, J, L)
+
+# Tables plates indexées [pièce][rotation], alignées sur ALL_TETROMINOES :
+# les géométries et bitboards de toutes les rotations sans passer par les
+# attributs des instances.
+PIECE_ROTATIONS: Tuple[Tuple[Tuple[Coordinate, ...], ...], ...] = tuple(
+    t.rotations for t in ALL_TETROMINOES
+)
+PIECE_BITBOARDS: Tuple[Tuple[int, ...], ...] = tuple(t.bitmasks for t in ALL_TETROMINOES)
+
+_PIECE_INDEX = {t.name: i for i, t in enumerate(ALL_TETROMINOES)}
+
+if np is not None:
+    # Formes empaquetées en SoA : (pièces, rotations, cellules, xy) en int8
+    # contigu. Les rotations manquantes sont répétées cycliquement, si bien
+    # que SHAPES[p, r & 3] est valide pour toute pièce.
+    SHAPES = np.array(
+        [[t.rotations[r % len(t.rotations)] for r in range(4)] for t in ALL_TETROMINOES],
+        dtype=np.int8,
+    )
+
+    def shape_array(tetromino: Tetromino, rotation_index: int) -> "np.ndarray":
+        """Return the (4, 2) int8 offset view for a piece rotation."""
+        return SHAPES[_PIECE_INDEX[tetromino.name], rotation_index & 3]
+
+else:  # pragma: no cover - numpy absent
+    SHAPES = None
+
+    def shape_array(tetromino: Tetromino, rotation_index: int):
+        raise RuntimeError("numpy est requis pour shape_array")
+
+# Pré-chauffe le cache de rotations pour éviter tout départ à froid en partie.
+for _tetromino in ALL_TETROMINOES:
+    for _index in range(len(_tetromino.rotations)):
+        _tetromino.rotated(_index)
+del _tetromino, _index
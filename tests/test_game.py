@@ -31,18 +31,18 @@ def test_piece_rotation_and_line_clear(temp_manager: ProfileManager) -> None:
     assert game.active.state.rotation_index == 0
 
     # Prepare the board to clear a line when the I piece locks.
-    bottom = game.board.grid[-1]
+    bottom_y = game.board.height - 1
     for x in range(game.board.width):
-        bottom[x] = "X"
+        game.board.set_cell(x, bottom_y, "X")
     for x in range(3, 7):
-        bottom[x] = None
+        game.board.set_cell(x, bottom_y, None)
 
     # Soft drop the piece until it rests on the filled row then lock it.
     while game.soft_drop():
         pass
     game.tick()
 
-    assert game.board.grid[-1] == [None] * game.board.width
+    assert game.board.rows()[-1] == [None] * game.board.width
     assert game.score_manager.score == 119
     assert game.score_manager.total_lines == 1
 
@@ -25,6 +25,37 @@ def test_profile_creation_and_persistence(tmp_path: Path) -> None:
     assert top and top[0]["score"] == 1200
 
 
+def test_scores_appended_to_jsonl(tmp_path: Path) -> None:
+    data_file = tmp_path / "profiles.json"
+    manager = ProfileManager(data_file)
+    manager.create_profile("Céline")
+    manager.record_game("Céline", score=500, lines=4)
+    manager.record_game("Céline", score=900, lines=8)
+
+    log_lines = (tmp_path / "scores.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(log_lines) == 2
+
+    top = ProfileManager(data_file).top_scores()
+    assert [entry["score"] for entry in top] == [900, 500]
+
+
+def test_batch_defers_writes_until_exit(tmp_path: Path) -> None:
+    data_file = tmp_path / "profiles.json"
+    manager = ProfileManager(data_file)
+    manager.create_profile("Diane")
+
+    with manager.batch():
+        manager.record_game("Diane", score=100, lines=1)
+        manager.record_game("Diane", score=200, lines=2)
+        assert not (tmp_path / "scores.jsonl").exists()
+        # Les scores en attente restent visibles en mémoire.
+        assert len(manager.top_scores()) == 2
+
+    reloaded = ProfileManager(data_file)
+    assert reloaded.get_profile("Diane").games_played == 2
+    assert reloaded.top_scores()[0]["score"] == 200
+
+
 def test_duplicate_profile_raises(tmp_path: Path) -> None:
     data_file = tmp_path / "profiles.json"
     manager = ProfileManager(data_file)
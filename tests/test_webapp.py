@@ -21,6 +21,43 @@ def test_healthcheck(tmp_path: Path) -> None:
     assert response.data == b"ok"
 
 
+def test_index_etag_returns_304(tmp_path: Path) -> None:
+    client = create_test_client(tmp_path)
+    first = client.get("/")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    status, _, body = client.app.index({"HTTP_IF_NONE_MATCH": etag})
+    assert status.value == 304
+    assert body == b""
+
+
+def test_index_etag_changes_beyond_top20(tmp_path: Path) -> None:
+    client = create_test_client(tmp_path)
+    client.post("/api/profiles", json={"name": "Alice"})
+    for score in range(25):
+        client.post("/api/scores", json={"profile": "Alice", "score": score, "lines": 1})
+
+    before = client.get("/")
+    client.post("/api/scores", json={"profile": "Alice", "score": 9999, "lines": 4})
+    after = client.get("/")
+
+    assert before.data != after.data
+    assert before.headers["etag"] != after.headers["etag"]
+    # L'ancien validateur ne doit plus produire de 304 périmé.
+    status, _, _ = client.app.index({"HTTP_IF_NONE_MATCH": before.headers["etag"]})
+    assert status.value == 200
+
+
+def test_index_escapes_profile_names(tmp_path: Path) -> None:
+    client = create_test_client(tmp_path)
+    client.post("/api/profiles", json={"name": "<script>alert(1)</script>"})
+
+    html = client.get("/").get_data(as_text=True)
+    assert "<script>alert(1)</script>" not in html
+    assert "&lt;script&gt;" in html
+
+
 def test_profile_and_score_api(tmp_path: Path) -> None:
     client = create_test_client(tmp_path)
 